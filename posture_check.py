@@ -4,8 +4,10 @@ Posture Check - A macOS menu bar app that reminds you to check your posture.
 Uses PyObjC directly for better macOS compatibility.
 """
 
+import time
+
 import objc
-from Foundation import NSObject, NSTimer, NSRunLoop, NSDefaultRunLoopMode
+from Foundation import NSObject, NSTimer, NSRunLoop, NSRunLoopCommonModes, NSMakeRect
 from AppKit import (
     NSApplication,
     NSStatusBar,
@@ -18,15 +20,68 @@ from AppKit import (
     NSAlertFirstButtonReturn,
     NSTextField,
 )
-from Foundation import NSMakeRect
-import UserNotifications
+from UserNotifications import (
+    UNUserNotificationCenter,
+    UNAuthorizationOptionAlert,
+    UNAuthorizationOptionSound,
+    UNMutableNotificationContent,
+    UNNotificationSound,
+    UNNotificationRequest,
+)
 
 # Configuration
-CHECK_INTERVAL_SECONDS = 5  # How often to check/update timer
+CHECK_INTERVAL_SECONDS = 5  # How often to check for a due reminder while the menu is closed
+CHECK_TOLERANCE = 2.0  # Leeway that lets macOS coalesce check wakeups
+LIVE_UPDATE_INTERVAL_SECONDS = 1  # Display refresh cadence while the menu is open
+LIVE_UPDATE_TOLERANCE = 0.5
+PROGRESS_BAR_SEGMENTS = 10
+MAX_INTERVAL_MINUTES = 120
+DEFAULT_REMINDER_INTERVAL_SECONDS = 20 * 60  # Default: 20 minutes
+DEFAULT_NOTIFICATION_IDENTIFIER = "posture_check"
+NOTIFICATION_THREAD_IDENTIFIER = "posture.reminder"  # Groups reminders in Notification Center
+
+# Timer display decorations
+_PREFIX_ACTIVE = "⏱ "
+_PREFIX_PAUSED = "⏸ "
+_SUFFIX_PAUSED = " (paused)"
+
+# Menu control state keyed by (timer_enabled, timer_paused):
+# (toggle item title, pause item hidden, pause item title or None to leave it as is)
+_STATES = {
+    (False, False): ("Enable Timer", True, None),
+    (True, False): ("Disable Timer", False, "Pause Timer"),
+    (True, True): ("Disable Timer", False, "Resume Timer"),
+}
+_INITIAL_PAUSE_TITLE = _STATES[(True, False)][2]
+
+# Every possible progress bar, indexed by number of filled segments
+_BAR_CACHE = [
+    f"[{'█' * i}{'░' * (PROGRESS_BAR_SEGMENTS - i)}]" for i in range(PROGRESS_BAR_SEGMENTS + 1)
+]
+
+# Zero-padded numbers for MM:SS, covering every minute and second value we can display
+_ZPAD = [f"{i:02d}" for i in range(max(60, MAX_INTERVAL_MINUTES + 1))]
+
+
+def _notification_permission_handler(granted, error):
+    """Completion handler for the permission request; the result is not needed."""
 
 
 class PostureCheckApp(NSObject):
     def init(self):
+        return self.initWithReminderInterval_notificationIdentifier_(
+            DEFAULT_REMINDER_INTERVAL_SECONDS, DEFAULT_NOTIFICATION_IDENTIFIER
+        )
+
+    @objc.typedSelector(b"@@:q@")
+    def initWithReminderInterval_notificationIdentifier_(self, reminder_interval_seconds, notification_identifier):
+        """Designated initializer; lets one class serve differently-timed reminder apps."""
+        # Same whole-minute range the interval dialog accepts, which _ZPAD is sized for
+        minutes, remainder = divmod(reminder_interval_seconds, 60)
+        if remainder or not 1 <= minutes <= MAX_INTERVAL_MINUTES:
+            raise ValueError(
+                f"reminder_interval_seconds must be a whole number of minutes from 1 to {MAX_INTERVAL_MINUTES}"
+            )
         self = objc.super(PostureCheckApp, self).init()
         if self is None:
             return None
@@ -36,8 +91,16 @@ class PostureCheckApp(NSObject):
         self.elapsed_active_seconds = 0
         self.cycles_completed = 0
         self.menu_is_open = False
-        self.live_update_timer = None
-        self.reminder_interval_seconds = 20 * 60  # Default: 20 minutes
+        self._run_start_mono = 0.0  # Monotonic time the current cycle started
+        self._paused_accum = 0.0  # Seconds spent paused during the current cycle
+        self._pause_started = None  # Monotonic time of the current pause, if paused
+        self.update_timer = None
+        self._last_timer_title = None
+        self._last_cycles_title = None
+        self._interval_alert = None
+        self._interval_input = None
+        self.reminder_interval_seconds = reminder_interval_seconds
+        self.notification_identifier = notification_identifier
 
         # Create status bar item
         self.status_bar = NSStatusBar.systemStatusBar()
@@ -62,19 +125,23 @@ class PostureCheckApp(NSObject):
         # Separator
         self.menu.addItem_(NSMenuItem.separatorItem())
 
+        # Toggle and pause items start out in the disabled state from _STATES
+        toggle_title, pause_hidden, _ = _STATES[(False, False)]
+        self._applied_state = (toggle_title, pause_hidden, _INITIAL_PAUSE_TITLE)
+
         # Toggle button (Enable/Disable)
         self.toggle_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Enable Timer", "toggleTimer:", ""
+            toggle_title, "toggleTimer:", ""
         )
         self.toggle_item.setTarget_(self)
         self.menu.addItem_(self.toggle_item)
 
         # Pause/Resume button
         self.pause_item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            "Pause Timer", "pauseTimer:", ""
+            _INITIAL_PAUSE_TITLE, "pauseTimer:", ""
         )
         self.pause_item.setTarget_(self)
-        self.pause_item.setHidden_(True)
+        self.pause_item.setHidden_(pause_hidden)
         self.menu.addItem_(self.pause_item)
 
         # Reset button
@@ -104,123 +171,188 @@ class PostureCheckApp(NSObject):
         self.status_item.setMenu_(self.menu)
         self.menu.setDelegate_(self)
 
-        # Start update timer
-        self.update_timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            CHECK_INTERVAL_SECONDS, self, "tick:", None, True
-        )
-        NSRunLoop.currentRunLoop().addTimer_forMode_(self.update_timer, NSDefaultRunLoopMode)
+        # Notification content is reused for every reminder; only the body changes
+        self._notif_sound = UNNotificationSound.defaultSound()
+        self._notif_content = UNMutableNotificationContent.alloc().init()
+        self._notif_content.setTitle_("Check your posture")
+        self._notif_content.setSound_(self._notif_sound)
+        self._notif_content.setThreadIdentifier_(NOTIFICATION_THREAD_IDENTIFIER)
 
         # Request notification permission
         self.request_notification_permission()
 
         return self
 
+    def _start_tick_timer(self):
+        """Schedule the tick timer if it isn't already running."""
+        if self.update_timer is not None:
+            return
+        # Elapsed time comes from the monotonic clock, so the cadence only sets display
+        # freshness and reminder latency: fast while the menu is visible, slow otherwise
+        if self.menu_is_open:
+            interval, tolerance = LIVE_UPDATE_INTERVAL_SECONDS, LIVE_UPDATE_TOLERANCE
+        else:
+            interval, tolerance = CHECK_INTERVAL_SECONDS, CHECK_TOLERANCE
+        self.update_timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+            interval, self, "tick:", None, True
+        )
+        self.update_timer.setTolerance_(tolerance)
+        # Common modes so it keeps firing while the menu is tracking
+        NSRunLoop.currentRunLoop().addTimer_forMode_(self.update_timer, NSRunLoopCommonModes)
+
+    def _stop_tick_timer(self):
+        """Invalidate the tick timer so the app stops waking up while idle."""
+        if self.update_timer is None:
+            return
+        self.update_timer.invalidate()
+        self.update_timer = None
+
+    def _sync_tick_timer(self):
+        """Keep the tick timer scheduled only while the countdown is running."""
+        # Disabled or paused means nothing changes on screen or on the clock, so no
+        # timer stays registered and the main run loop can sleep until the next event
+        if self.timer_enabled and not self.timer_paused:
+            self._start_tick_timer()
+        else:
+            self._stop_tick_timer()
+
+    def _reschedule_tick_timer(self):
+        """Re-arm the tick timer at the cadence for the current menu state, if it should run."""
+        self._stop_tick_timer()
+        self._sync_tick_timer()
+
+    def _restart_cycle(self):
+        """Start counting the current cycle from zero."""
+        now = time.monotonic()
+        self._run_start_mono = now
+        self._paused_accum = 0.0
+        self._pause_started = now if self.timer_paused else None
+        self.elapsed_active_seconds = 0
+
+    def _update_elapsed(self):
+        """Recompute elapsed_active_seconds from the monotonic clock."""
+        if not self.timer_enabled:
+            return
+        # time.monotonic() stops while the Mac sleeps, so sleep never counts as active time
+        # and late or coalesced ticks can't make the count drift
+        end = self._pause_started if self._pause_started is not None else time.monotonic()
+        self.elapsed_active_seconds = int(end - self._run_start_mono - self._paused_accum)
+
     def request_notification_permission(self):
         """Request permission to send notifications."""
-        center = UserNotifications.UNUserNotificationCenter.currentNotificationCenter()
+        center = UNUserNotificationCenter.currentNotificationCenter()
         center.requestAuthorizationWithOptions_completionHandler_(
-            UserNotifications.UNAuthorizationOptionAlert | UserNotifications.UNAuthorizationOptionSound,
-            lambda granted, error: print(f"Notification permission: {'granted' if granted else 'denied'}")
+            UNAuthorizationOptionAlert | UNAuthorizationOptionSound,
+            _notification_permission_handler,
         )
 
     @objc.typedSelector(b"v@:@")
     def menuWillOpen_(self, menu):
-        """Called when menu opens - start live updates."""
+        """Called when menu opens - tick_ refreshes the display while open."""
         self.menu_is_open = True
+        self._reschedule_tick_timer()
+        self._update_elapsed()
         self.update_display()
-        self.live_update_timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
-            1.0, self, "liveUpdate:", None, True
-        )
-        NSRunLoop.currentRunLoop().addTimer_forMode_(self.live_update_timer, NSDefaultRunLoopMode)
 
     @objc.typedSelector(b"v@:@")
     def menuDidClose_(self, menu):
         """Called when menu closes - stop live updates."""
         self.menu_is_open = False
-        if self.live_update_timer:
-            self.live_update_timer.invalidate()
-            self.live_update_timer = None
-
-    @objc.typedSelector(b"v@:@")
-    def liveUpdate_(self, timer):
-        """Called every second when menu is open for live display updates."""
-        self.update_display()
+        self._reschedule_tick_timer()
 
     def format_time_elapsed(self):
         """Format elapsed time as MM:SS."""
         elapsed = min(self.elapsed_active_seconds, self.reminder_interval_seconds)
-        minutes = elapsed // 60
-        seconds = elapsed % 60
-        return f"{minutes:02d}:{seconds:02d}"
+        return _ZPAD[elapsed // 60] + ":" + _ZPAD[elapsed % 60]
 
-    def format_progress_bar(self, segments=10):
+    def format_progress_bar(self):
         """Create a progress bar showing elapsed time."""
         progress = self.elapsed_active_seconds / self.reminder_interval_seconds
         progress = min(1.0, max(0.0, progress))
-        filled = int(progress * segments)
-        empty = segments - filled
-        return f"[{'█' * filled}{'░' * empty}]"
+        return _BAR_CACHE[int(progress * PROGRESS_BAR_SEGMENTS)]
 
     @objc.typedSelector(b"v@:@")
     def tick_(self, timer):
-        """Called every CHECK_INTERVAL_SECONDS."""
+        """Called every CHECK_INTERVAL_SECONDS, or every second while the menu is open."""
         if not self.timer_enabled or self.timer_paused:
             return
 
-        self.elapsed_active_seconds += CHECK_INTERVAL_SECONDS
-
-        if self.elapsed_active_seconds >= self.reminder_interval_seconds:
-            self.send_reminder()
-            self.cycles_completed += 1
-            self.elapsed_active_seconds = 0
-
-        self.update_display()
+        # Drain Cocoa temporaries from menu/notification updates every tick
+        with objc.autorelease_pool():
+            self._update_elapsed()
+
+            if self.elapsed_active_seconds >= self.reminder_interval_seconds:
+                self.send_reminder()
+                self.cycles_completed += 1
+                self._restart_cycle()
+
+            # Nothing is visible while the menu is closed; menuWillOpen_ refreshes on open
+            if self.menu_is_open:
+                self.update_display()
+
+    def _apply_state(self):
+        """Sync the toggle and pause items with the current state, touching only what changed."""
+        # Paused only has meaning while enabled, so a stray pause while disabled maps to (False, False)
+        enabled = self.timer_enabled
+        toggle_title, pause_hidden, pause_title = _STATES[(enabled, enabled and self.timer_paused)]
+        old_toggle_title, old_pause_hidden, old_pause_title = self._applied_state
+        if pause_title is None:
+            pause_title = old_pause_title
+
+        if toggle_title != old_toggle_title:
+            self.toggle_item.setTitle_(toggle_title)
+        if pause_hidden != old_pause_hidden:
+            self.pause_item.setHidden_(pause_hidden)
+        if pause_title != old_pause_title:
+            self.pause_item.setTitle_(pause_title)
+
+        self._applied_state = (toggle_title, pause_hidden, pause_title)
 
     def update_display(self):
         """Update menu display with progress bar, elapsed time, and cycles."""
         if self.timer_enabled:
-            progress_bar = self.format_progress_bar()
-            elapsed = self.format_time_elapsed()
             if self.timer_paused:
-                self.timer_menu_item.setTitle_(f"⏸ {progress_bar} {elapsed} (paused)")
+                prefix, suffix = _PREFIX_PAUSED, _SUFFIX_PAUSED
             else:
-                self.timer_menu_item.setTitle_(f"⏱ {progress_bar} {elapsed}")
+                prefix, suffix = _PREFIX_ACTIVE, ""
+            timer_title = f"{prefix}{self.format_progress_bar()} {self.format_time_elapsed()}{suffix}"
         else:
-            self.timer_menu_item.setTitle_("Timer Off")
+            timer_title = "Timer Off"
 
-        self.cycles_menu_item.setTitle_(f"Cycles completed: {self.cycles_completed}")
+        # Only touch the menu items when their text actually changes
+        if timer_title != self._last_timer_title:
+            self.timer_menu_item.setTitle_(timer_title)
+            self._last_timer_title = timer_title
+
+        cycles_title = f"Cycles completed: {self.cycles_completed}"
+        if cycles_title != self._last_cycles_title:
+            self.cycles_menu_item.setTitle_(cycles_title)
+            self._last_cycles_title = cycles_title
 
     def send_reminder(self):
         """Send notification."""
         elapsed = self.format_time_elapsed()
-        content = UserNotifications.UNMutableNotificationContent.alloc().init()
-        content.setTitle_("Check your posture")
-        content.setBody_(f"{elapsed} elapsed")
-        content.setSound_(UserNotifications.UNNotificationSound.defaultSound())
+        self._notif_content.setBody_(f"{elapsed} elapsed")
 
-        request = UserNotifications.UNNotificationRequest.requestWithIdentifier_content_trigger_(
-            "posture_check", content, None
+        # Stable identifier so a new reminder replaces the previous one instead of stacking
+        request = UNNotificationRequest.requestWithIdentifier_content_trigger_(
+            self.notification_identifier, self._notif_content, None
         )
 
-        center = UserNotifications.UNUserNotificationCenter.currentNotificationCenter()
+        center = UNUserNotificationCenter.currentNotificationCenter()
         center.addNotificationRequest_withCompletionHandler_(request, None)
 
     @objc.typedSelector(b"v@:@")
     def toggleTimer_(self, sender):
         """Enable or disable timer."""
         self.timer_enabled = not self.timer_enabled
+        self.timer_paused = False
 
         if self.timer_enabled:
-            self.toggle_item.setTitle_("Disable Timer")
-            self.pause_item.setHidden_(False)
-            self.pause_item.setTitle_("Pause Timer")
-            self.timer_paused = False
-            self.elapsed_active_seconds = 0
-        else:
-            self.toggle_item.setTitle_("Enable Timer")
-            self.pause_item.setHidden_(True)
-            self.timer_paused = False
+            self._restart_cycle()
 
+        self._sync_tick_timer()
+        self._apply_state()
         self.update_display()
 
     @objc.typedSelector(b"v@:@")
@@ -228,37 +360,49 @@ class PostureCheckApp(NSObject):
         """Pause or resume the timer."""
         self.timer_paused = not self.timer_paused
 
+        now = time.monotonic()
         if self.timer_paused:
-            self.pause_item.setTitle_("Resume Timer")
-        else:
-            self.pause_item.setTitle_("Pause Timer")
-
+            self._pause_started = now
+        elif self._pause_started is not None:
+            self._paused_accum += now - self._pause_started
+            self._pause_started = None
+        self._update_elapsed()
+
+        self._sync_tick_timer()
+        self._apply_state()
         self.update_display()
 
     @objc.typedSelector(b"v@:@")
     def resetTimer_(self, sender):
         """Reset timer and cycle count to zero."""
-        self.elapsed_active_seconds = 0
         self.cycles_completed = 0
         self.timer_paused = False
-        if self.timer_enabled:
-            self.pause_item.setTitle_("Pause Timer")
+        self._restart_cycle()
+        self._sync_tick_timer()
+        self._apply_state()
         self.update_display()
 
     @objc.typedSelector(b"v@:@")
     def showIntervalDialog_(self, sender):
         """Show dialog to set custom interval."""
-        alert = NSAlert.alloc().init()
-        alert.setMessageText_("Set Reminder Interval")
-        alert.setInformativeText_("Enter interval in minutes (1-120):")
-        alert.setAlertStyle_(NSAlertStyleInformational)
-        alert.addButtonWithTitle_("OK")
-        alert.addButtonWithTitle_("Cancel")
-
-        current_minutes = self.reminder_interval_seconds // 60
-        input_field = NSTextField.alloc().initWithFrame_(NSMakeRect(0, 0, 200, 24))
-        input_field.setStringValue_(str(current_minutes))
-        alert.setAccessoryView_(input_field)
+        # Build the alert on first use and reuse it for later opens
+        if self._interval_alert is None:
+            alert = NSAlert.alloc().init()
+            alert.setMessageText_("Set Reminder Interval")
+            alert.setInformativeText_(f"Enter interval in minutes (1-{MAX_INTERVAL_MINUTES}):")
+            alert.setAlertStyle_(NSAlertStyleInformational)
+            alert.addButtonWithTitle_("OK")
+            alert.addButtonWithTitle_("Cancel")
+
+            input_field = NSTextField.alloc().initWithFrame_(NSMakeRect(0, 0, 200, 24))
+            alert.setAccessoryView_(input_field)
+
+            self._interval_alert = alert
+            self._interval_input = input_field
+
+        alert = self._interval_alert
+        input_field = self._interval_input
+        input_field.setStringValue_(str(self.reminder_interval_seconds // 60))
 
         NSApplication.sharedApplication().activateIgnoringOtherApps_(True)
         alert.window().setInitialFirstResponder_(input_field)
@@ -266,9 +410,9 @@ class PostureCheckApp(NSObject):
         if alert.runModal() == NSAlertFirstButtonReturn:
             try:
                 value = int(input_field.stringValue())
-                if 1 <= value <= 120:
+                if 1 <= value <= MAX_INTERVAL_MINUTES:
                     self.reminder_interval_seconds = value * 60
-                    self.elapsed_active_seconds = 0
+                    self._restart_cycle()
                     self.update_display()
             except ValueError:
                 pass